@@ -6,35 +6,31 @@ the remaining tickers have complete data with no NULL values
 
 import sys
 import sqlite3
-import pandas as pd
-from tabulate import tabulate
-from datetime import datetime
 
 from src.data_acquisition.create_database import DB_PATH
+from src.utils.ticker_stats import get_ticker_stats
 from src.utils.file_io import get_db_connection
 from src.utils.logger import logger
 
-def delete_ticker_data(ticker):
+def delete_ticker_data(cursor, ticker):
     """
     Delete all data for a specific ticker from the database
     
     Args:
+        cursor (sqlite3.Cursor): Database cursor
         ticker (str): Ticker symbol to delete
         
     Returns:
         int: Number of records deleted
     """
     try:
-        conn = get_db_connection(DB_PATH)
-        cursor = conn.cursor()
-        
         # Get record count before deletion
         cursor.execute("SELECT COUNT(*) as count FROM ohlcv WHERE ticker = ?", (ticker,))
         count_before = cursor.fetchone()['count']
         
         # Delete records
         cursor.execute("DELETE FROM ohlcv WHERE ticker = ?", (ticker,))
-        conn.commit()
+        cursor.connection.commit()
         
         # Check if records were deleted
         cursor.execute("SELECT COUNT(*) as count FROM ohlcv WHERE ticker = ?", (ticker,))
@@ -44,7 +40,6 @@ def delete_ticker_data(ticker):
         print(f"Deleted {deleted_count} records for {ticker}")
         logger.info(f"Deleted {deleted_count} records for {ticker}")
         
-        conn.close()
         return deleted_count
         
     except Exception as e:
@@ -52,17 +47,17 @@ def delete_ticker_data(ticker):
         logger.error(f"Error deleting data for {ticker}: {str(e)}")
         return 0
 
-def check_for_null_values():
+def check_for_null_values(cursor):
     """
     Check for NULL values in the database
     
+    Args:
+        cursor (sqlite3.Cursor): Database cursor
+    
     Returns:
         bool: True if no NULL values found, False otherwise
     """
     try:
-        conn = get_db_connection(DB_PATH)
-        cursor = conn.cursor()
-        
         # Check for NULL values in any column
         cursor.execute("""
         SELECT ticker, date, COUNT(*) as count
@@ -79,86 +74,44 @@ def check_for_null_values():
             for record in null_records:
                 print(f"Ticker: {record['ticker']}, Date: {record['date']}, Count: {record['count']}")
             
-            conn.close()
             return False
         else:
             print("No NULL values found in the database.")
-            conn.close()
             return True
         
     except Exception as e:
         print(f"Error checking for NULL values: {str(e)}")
         return False
 
-def analyze_tickers():
+def analyze_tickers(cursor):
     """
     Analyze all tickers in the database and display statistics
     
+    Args:
+        cursor (sqlite3.Cursor): Database cursor
+    
     Returns:
         int: Number of tickers found
     """
     try:
-        conn = get_db_connection(DB_PATH)
-        cursor = conn.cursor()
-        
-        # Get list of all tickers
-        cursor.execute("SELECT DISTINCT ticker FROM ohlcv ORDER BY ticker")
-        tickers = [row['ticker'] for row in cursor.fetchall()]
-        
-        # Count total records
-        cursor.execute("SELECT COUNT(*) as count FROM ohlcv")
-        total_count = cursor.fetchone()['count']
+        # Get per-ticker stats from the ticker_stats view
+        df = get_ticker_stats(cursor.connection, ['ticker', 'first_date', 'last_date', 'record_count'])
+        tickers = df['Ticker'].tolist()
+        total_count = df['Total Records'].sum()
         
         print(f"Database contains {total_count} total records across {len(tickers)} tickers")
         
         # Check if AAPL is in the list
-        if 'AAPL' in tickers:
+        ticker_set = set(tickers)
+        if 'AAPL' in ticker_set:
             print("WARNING: AAPL is still in the database")
         else:
             print("AAPL has been successfully removed from the database")
         
-        # Create a list to store ticker data
-        ticker_data = []
-        
-        # Get stats for each ticker
-        for ticker in tickers:
-            # Get earliest date
-            cursor.execute(
-                "SELECT date FROM ohlcv WHERE ticker = ? ORDER BY date ASC LIMIT 1", 
-                (ticker,)
-            )
-            earliest_date = cursor.fetchone()['date']
-            
-            # Get latest date
-            cursor.execute(
-                "SELECT date FROM ohlcv WHERE ticker = ? ORDER BY date DESC LIMIT 1", 
-                (ticker,)
-            )
-            latest_date = cursor.fetchone()['date']
-            
-            # Get total records
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM ohlcv WHERE ticker = ?", 
-                (ticker,)
-            )
-            record_count = cursor.fetchone()['count']
-            
-            # Add to list
-            ticker_data.append({
-                'Ticker': ticker,
-                'First Date': earliest_date,
-                'Last Date': latest_date,
-                'Total Records': record_count
-            })
-        
-        # Create DataFrame for nice display
-        df = pd.DataFrame(ticker_data)
-        
         # Print table
         print("\nTicker Statistics:")
-        print(tabulate(df, headers='keys', tablefmt='pretty', showindex=False))
+        print(df.to_string(index=False))
         
-        conn.close()
         return len(tickers)
         
     except Exception as e:
@@ -168,17 +121,24 @@ def analyze_tickers():
 if __name__ == "__main__":
     print("Starting database cleanup...")
     
-    # Delete Apple data
-    print("\n1. Removing Apple (AAPL) data from the database")
-    deleted_count = delete_ticker_data('AAPL')
-    
-    # Check for NULL values
-    print("\n2. Checking for NULL values in the database")
-    no_nulls = check_for_null_values()
-    
-    # Analyze remaining tickers
-    print("\n3. Analyzing remaining tickers")
-    ticker_count = analyze_tickers()
+    # Share one connection and cursor across all steps
+    conn = get_db_connection(DB_PATH)
+    try:
+        cursor = conn.cursor()
+        
+        # Delete Apple data
+        print("\n1. Removing Apple (AAPL) data from the database")
+        deleted_count = delete_ticker_data(cursor, 'AAPL')
+        
+        # Check for NULL values
+        print("\n2. Checking for NULL values in the database")
+        no_nulls = check_for_null_values(cursor)
+        
+        # Analyze remaining tickers
+        print("\n3. Analyzing remaining tickers")
+        ticker_count = analyze_tickers(cursor)
+    finally:
+        conn.close()
     
     # Print summary
     print("\nSummary:")
@@ -0,0 +1,109 @@
+import os
+import sys
+
+# Add the project root to the path so we can import our modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.utils.file_io import get_db_connection
+from src.utils.logger import logger
+
+DB_PATH = 'data/market_data.db'
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS ohlcv (
+    ticker TEXT NOT NULL,
+    date TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume INTEGER,
+    PRIMARY KEY (ticker, date)
+);
+
+-- Partial index over the rows matched by the NULL check, keyed on its
+-- GROUP BY columns so the planner can read it instead of the full
+-- (ticker, date) index (it may still prefer the latter on small tables)
+CREATE INDEX IF NOT EXISTS idx_ohlcv_nulls ON ohlcv(ticker, date)
+WHERE ticker IS NULL OR date IS NULL OR open IS NULL
+   OR high IS NULL OR low IS NULL OR close IS NULL OR volume IS NULL;
+"""
+
+# Per-ticker statistics shared by the db_tests analytics scripts, both as the
+# ticker_stats view and as a fallback on databases created before the view existed
+TICKER_STATS_SELECT = """
+SELECT
+    ticker,
+    MIN(date) AS first_date,
+    MAX(date) AS last_date,
+    COUNT(*) AS record_count,
+    CAST(julianday(MAX(date)) - julianday(MIN(date)) AS INTEGER) AS date_range_days,
+    SUM(CASE WHEN date >= date('now', 'localtime', '-1095 days') THEN 1 ELSE 0 END) AS recent_3y_count,
+    SUM(CASE WHEN date >= date('now', 'localtime', 'start of year') THEN 1 ELSE 0 END) AS ytd_count,
+    AVG(open) AS avg_open,
+    AVG(close) AS avg_close,
+    MAX(high) AS max_high,
+    MIN(low) AS min_low,
+    SUM(volume) AS total_volume,
+    AVG(volume) AS avg_volume
+FROM ohlcv
+GROUP BY ticker
+"""
+
+TICKER_STATS_VIEW_SQL = f"CREATE VIEW IF NOT EXISTS ticker_stats AS {TICKER_STATS_SELECT}"
+
+# Only needed for databases loaded before ohlcv had a primary key; otherwise
+# the primary key's autoindex already serves per-ticker date lookups
+TICKER_DATE_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_ohlcv_ticker_date ON ohlcv(ticker, date)"
+
+# Per-connection writer settings, applied by every writer
+CONNECTION_PRAGMA_SQL = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+"""
+
+# Database setup: WAL is persisted in the file and lets readers run during bulk loads
+PRAGMA_SQL = """
+PRAGMA journal_mode=WAL;
+""" + CONNECTION_PRAGMA_SQL
+
+def create_database(db_path=DB_PATH):
+    """
+    Create the market data database schema, indexes and views if they don't exist
+
+    Args:
+        db_path (str): Path to the SQLite database file
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+        conn = get_db_connection(db_path)
+        conn.executescript(PRAGMA_SQL)
+        conn.executescript(SCHEMA_SQL)
+        conn.execute(TICKER_STATS_VIEW_SQL)
+
+        # Avoid maintaining a second B-tree identical to the primary key index
+        has_primary_key = any(index['origin'] == 'pk' for index in conn.execute("PRAGMA index_list(ohlcv)"))
+        if has_primary_key:
+            conn.execute("DROP INDEX IF EXISTS idx_ohlcv_ticker_date")
+        else:
+            conn.execute(TICKER_DATE_INDEX_SQL)
+
+        # Refresh planner statistics so the new indexes get picked up
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.close()
+
+        logger.info(f"Database schema ready at {db_path}")
+        return True
+
+    except Exception as e:
+        logger.error(f"Error creating database {db_path}: {str(e)}")
+        return False
+
+if __name__ == "__main__":
+    success = create_database()
+    sys.exit(0 if success else 1)
@@ -1,13 +1,22 @@
 import requests
+import argparse
 import os
+import io
 import sys
 import json
+import pandas as pd
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
 
 # Add the project root to the path so we can import our modules
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from src.utils.file_io import load_yaml_config
+from src.data_acquisition.create_database import DB_PATH, CONNECTION_PRAGMA_SQL
+from src.utils.file_io import load_yaml_config, get_db_connection, parse_json, save_json, load_json
 from src.utils.logger import logger
 
 class AlphaVantageAPI:
@@ -31,6 +40,7 @@ class AlphaVantageAPI:
                 self.base_url = config['alpha_vantage']['base_url']
                 self.output_format = config['alpha_vantage']['output_format']
                 self.rate_limit = config['alpha_vantage']['max_calls_per_minute']
+                self.cache_dir = config['alpha_vantage'].get('cache_dir', 'data/raw/cache')
             except Exception as e:
                 logger.error(f"Failed to load Alpha Vantage configuration: {str(e)}")
                 raise
@@ -39,32 +49,111 @@ class AlphaVantageAPI:
             self.base_url = 'https://www.alphavantage.co/query'
             self.output_format = 'json'
             self.rate_limit = 5
+            self.cache_dir = 'data/raw/cache'
+        
+        if type(self.rate_limit) is not int or self.rate_limit < 1:
+            logger.error(f"Invalid Alpha Vantage max_calls_per_minute: {self.rate_limit!r}")
+            raise ValueError(f"max_calls_per_minute must be a positive integer, got {self.rate_limit!r}")
+        
+        # Reuse keep-alive connections across requests, one per batch worker
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=self.rate_limit))
+        
+        # Timestamps of recent calls, used to enforce rate_limit calls per minute
+        self._call_times = deque()
+        self._rate_lock = threading.Lock()
+    
+    def _wait_for_rate_limit(self):
+        """
+        Block until another call fits within the rate_limit calls per 60 seconds window
+        """
+        with self._rate_lock:
+            while True:
+                now = time.monotonic()
+                while self._call_times and now - self._call_times[0] >= 60:
+                    self._call_times.popleft()
+                if len(self._call_times) < self.rate_limit:
+                    self._call_times.append(now)
+                    return
+                time.sleep(60 - (now - self._call_times[0]))
+    
+    def _cache_path(self, symbol, outputsize, datatype):
+        """
+        Get the path of the cached response for today, or None if caching is disabled
+        """
+        if not self.cache_dir:
+            return None
+        today = datetime.now().strftime('%Y%m%d')
+        return os.path.join(self.cache_dir, f"{symbol}_{outputsize}_{today}.{datatype}")
     
-    def get_daily_time_series(self, symbol, outputsize='compact'):
+    def _write_cache(self, cache_path, content):
+        """
+        Write a response to the cache and delete cached responses from earlier days
+        
+        Args:
+            cache_path (str): Path returned by _cache_path
+            content (dict or bytes): Parsed JSON response, or the raw CSV response body
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Cache files are named <symbol>_<outputsize>_<YYYYMMDD>.<datatype>
+        today = os.path.splitext(cache_path)[0].rsplit('_', 1)[-1]
+        for name in os.listdir(self.cache_dir):
+            stamp = os.path.splitext(name)[0].rsplit('_', 1)[-1]
+            if stamp.isdigit() and len(stamp) == 8 and stamp != today:
+                os.remove(os.path.join(self.cache_dir, name))
+        
+        if isinstance(content, bytes):
+            with open(cache_path, 'wb') as f:
+                f.write(content)
+        else:
+            save_json(content, cache_path)
+    
+    def get_daily_time_series(self, symbol, outputsize='compact', use_cache=False, datatype=None):
         """
         Fetch daily time series data for a given stock symbol
         
         Args:
             symbol (str): Stock ticker symbol
             outputsize (str): 'compact' for last 100 data points, 'full' for all available data
+            use_cache (bool): Reuse a response already fetched today from the disk cache,
+                for repeated development runs
+            datatype (str, optional): 'json' or 'csv'. If None, use the configured output format.
             
         Returns:
-            dict: Daily time series data
+            dict or pd.DataFrame: Daily time series data, a DataFrame when datatype is 'csv'
         """
+        if datatype is None:
+            datatype = self.output_format
+        
+        cache_path = self._cache_path(symbol, outputsize, datatype) if use_cache else None
+        if cache_path and os.path.exists(cache_path):
+            try:
+                data = pd.read_csv(cache_path) if datatype == 'csv' else load_json(cache_path)
+                logger.info(f"Loaded cached daily time series for {symbol} from {cache_path}")
+                return data
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache file: {str(e)}")
+        
         params = {
             'function': 'TIME_SERIES_DAILY',
             'symbol': symbol,
             'outputsize': outputsize,
             'apikey': self.api_key,
-            'datatype': self.output_format
+            'datatype': datatype
         }
         
         logger.info(f"Fetching daily time series for {symbol}")
         
         try:
-            response = requests.get(self.base_url, params=params)
+            self._wait_for_rate_limit()
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()  # Raise an exception for 4XX/5XX responses
-            data = response.json()
+            
+            if datatype == 'csv':
+                return self._parse_csv_response(symbol, response.content, cache_path)
+            
+            data = parse_json(response.content)
             
             # Check for API error messages
             if 'Error Message' in data:
@@ -72,6 +161,11 @@ class AlphaVantageAPI:
                 return None
             
             logger.info(f"Successfully fetched daily time series for {symbol}")
+            
+            # Only cache complete responses, not rate limit notes
+            if cache_path and 'Time Series (Daily)' in data:
+                self._write_cache(cache_path, data)
+            
             return data
         except requests.exceptions.RequestException as e:
             logger.error(f"Request error: {str(e)}")
@@ -83,12 +177,119 @@ class AlphaVantageAPI:
             logger.error(f"Unexpected error: {str(e)}")
             return None
 
-def test_alpha_vantage_api(ticker='AAPL'):
+    def _parse_csv_response(self, symbol, content, cache_path):
+        """
+        Parse a CSV time series response into a DataFrame, caching the raw bytes
+        
+        Args:
+            symbol (str): Stock ticker symbol
+            content (bytes): Response body
+            cache_path (str or None): Where to cache the response
+            
+        Returns:
+            pd.DataFrame: Daily time series data, or None on API errors
+        """
+        # API errors and rate limit notes are still returned as JSON
+        if content.lstrip().startswith(b'{'):
+            data = parse_json(content)
+            logger.error(f"Alpha Vantage API error: {data.get('Error Message', data)}")
+            return None
+        
+        data = pd.read_csv(io.BytesIO(content))
+        logger.info(f"Successfully fetched daily time series for {symbol}")
+        
+        if cache_path:
+            self._write_cache(cache_path, content)
+        
+        return data
+
+    def get_daily_time_series_batch(self, symbols, outputsize='compact', use_cache=False, datatype=None):
+        """
+        Fetch daily time series data for several stock symbols concurrently
+        
+        Args:
+            symbols (list): Stock ticker symbols
+            outputsize (str): 'compact' for last 100 data points, 'full' for all available data
+            use_cache (bool): Reuse responses already fetched today from the disk cache
+            datatype (str, optional): 'json' or 'csv'. If None, use the configured output format.
+            
+        Returns:
+            dict: Daily time series data keyed by symbol (None for failed symbols)
+        """
+        symbols = list(symbols)
+        with ThreadPoolExecutor(max_workers=self.rate_limit) as executor:
+            results = executor.map(
+                lambda symbol: self.get_daily_time_series(symbol, outputsize, use_cache, datatype),
+                symbols
+            )
+            return dict(zip(symbols, results))
+
+def iter_ohlcv_rows(symbol, data):
+    """
+    Yield ohlcv table rows from an Alpha Vantage daily time series response
+    
+    Args:
+        symbol (str): Stock ticker symbol
+        data (dict or pd.DataFrame): Response returned by get_daily_time_series
+        
+    Yields:
+        tuple: (ticker, date, open, high, low, close, volume)
+    """
+    # CSV responses already arrive in ohlcv column order
+    if isinstance(data, pd.DataFrame):
+        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        for date, open_, high, low, close, volume in data[columns].itertuples(index=False, name=None):
+            yield (symbol, date, float(open_), float(high), float(low), float(close), int(volume))
+        return
+    
+    time_series = data['Time Series (Daily)']
+    for date, values in time_series.items():
+        yield (
+            symbol,
+            date,
+            float(values['1. open']),
+            float(values['2. high']),
+            float(values['3. low']),
+            float(values['4. close']),
+            int(values['5. volume'])
+        )
+
+def store_daily_time_series(symbol, data, db_path=DB_PATH):
+    """
+    Store an Alpha Vantage daily time series response in the ohlcv table
+    
+    Args:
+        symbol (str): Stock ticker symbol
+        data (dict or pd.DataFrame): Response returned by get_daily_time_series
+        db_path (str): Path to the SQLite database file
+        
+    Returns:
+        int: Number of rows written
+    """
+    conn = get_db_connection(db_path)
+    try:
+        conn.executescript(CONNECTION_PRAGMA_SQL)
+        # Single transaction for the whole batch
+        with conn:
+            cursor = conn.executemany(
+                "INSERT OR REPLACE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)",
+                iter_ohlcv_rows(symbol, data)
+            )
+            row_count = cursor.rowcount
+    finally:
+        conn.close()
+    
+    logger.info(f"Stored {row_count} daily records for {symbol}")
+    return row_count
+
+def test_alpha_vantage_api(ticker='AAPL', save_raw=False, use_cache=False):
     """
     Test the Alpha Vantage API with a single ticker
     
     Args:
         ticker (str): Ticker symbol to test
+        save_raw (bool): Save the raw JSON response to data/raw for debugging
+        use_cache (bool): Reuse a response already fetched today instead of calling the API
         
     Returns:
         bool: True if successful, False otherwise
@@ -99,8 +300,8 @@ def test_alpha_vantage_api(ticker='AAPL'):
         # Create API client
         client = AlphaVantageAPI()
         
-        # Make request
-        data = client.get_daily_time_series(ticker)
+        # Make request, always as JSON since the checks below read the JSON structure
+        data = client.get_daily_time_series(ticker, use_cache=use_cache, datatype='json')
         
         if data is None:
             logger.error("Test failed: No data returned")
@@ -113,7 +314,7 @@ def test_alpha_vantage_api(ticker='AAPL'):
         
         # Get the latest trading day data
         time_series = data['Time Series (Daily)']
-        latest_date = list(time_series.keys())[0]
+        latest_date = next(iter(time_series))
         latest_data = time_series[latest_date]
         
         # Log the results
@@ -124,28 +325,40 @@ def test_alpha_vantage_api(ticker='AAPL'):
         logger.info(f"Close: {latest_data['4. close']}")
         logger.info(f"Volume: {latest_data['5. volume']}")
         
-        # Save sample data to a file
-        output_dir = 'data/raw'
-        os.makedirs(output_dir, exist_ok=True)
-        
-        output_file = os.path.join(output_dir, f"{ticker}_daily_{datetime.now().strftime('%Y%m%d')}.json")
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
-        
-        logger.info(f"Sample data saved to {output_file}")
+        # Save sample data to a file only when requested
+        if save_raw:
+            output_dir = 'data/raw'
+            os.makedirs(output_dir, exist_ok=True)
+            
+            output_file = os.path.join(output_dir, f"{ticker}_daily_{datetime.now().strftime('%Y%m%d')}.json")
+            save_json(data, output_file)
+            
+            logger.info(f"Sample data saved to {output_file}")
         return True
         
     except Exception as e:
         logger.error(f"Test failed with exception: {str(e)}")
         return False
 
+def parse_args(argv=None):
+    """
+    Parse command line arguments for the Alpha Vantage API test
+    
+    Args:
+        argv (list, optional): Arguments to parse. If None, use sys.argv.
+        
+    Returns:
+        argparse.Namespace: Parsed arguments with ticker, save_raw and use_cache
+    """
+    parser = argparse.ArgumentParser(description='Test the Alpha Vantage API with a single ticker')
+    parser.add_argument('ticker', nargs='?', default='AAPL', help='Ticker symbol to test')
+    parser.add_argument('--save-raw', action='store_true', help='Save the raw JSON response to data/raw')
+    parser.add_argument('--use-cache', action='store_true', help="Reuse today's cached response instead of calling the API")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
     # If run as a script, test the API
-    import sys
-    
-    ticker = 'AAPL'
-    if len(sys.argv) > 1:
-        ticker = sys.argv[1]
+    args = parse_args()
     
-    success = test_alpha_vantage_api(ticker)
+    success = test_alpha_vantage_api(args.ticker, save_raw=args.save_raw, use_cache=args.use_cache)
     sys.exit(0 if success else 1)
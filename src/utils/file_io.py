@@ -1,8 +1,33 @@
 import yaml
 import os
+import copy
 import json
+import mmap
+import sqlite3
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the C-implemented YAML loader when PyYAML was built with libyaml
+YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Buffer size for JSON writes and the size above which JSON reads are memory-mapped
+JSON_BUFFER_SIZE = 1024 * 1024
+
+# Memory-map up to this many bytes of each SQLite database; mmap_size is a
+# per-connection setting, so it is applied to every connection we open
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(abs_path, mtime):
+    """Parse a YAML file; mtime is part of the cache key so edits trigger a reload"""
+    with open(abs_path, 'r') as file:
+        return yaml.load(file, Loader=YamlLoader)
+
 def load_yaml_config(config_path):
     """
     Load a YAML configuration file
@@ -14,8 +39,9 @@ def load_yaml_config(config_path):
         dict: Configuration as a dictionary
     """
     try:
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        abs_path = os.path.abspath(config_path)
+        # Return a copy so callers can't mutate the cached config
+        return copy.deepcopy(_load_yaml_cached(abs_path, os.path.getmtime(abs_path)))
     except Exception as e:
         raise Exception(f"Error loading config file {config_path}: {str(e)}")
         
@@ -28,8 +54,16 @@ def save_json(data, file_path):
         file_path (str): Path to save the JSON file
     """
     try:
-        with open(file_path, 'w') as file:
-            json.dump(data, file, indent=4)
+        # Both branches write the same UTF-8 output with 2-space indents (the only
+        # indent orjson supports) and coerce non-string keys like json.dump does
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            with open(file_path, 'wb', buffering=JSON_BUFFER_SIZE) as file:
+                file.write(orjson.dumps(data, option=option))
+        else:
+            with open(file_path, 'w', encoding='utf-8') as file:
+                json.dump(data, file, indent=2, ensure_ascii=False)
+                file.write('\n')
     except Exception as e:
         raise Exception(f"Error saving JSON to {file_path}: {str(e)}")
 
@@ -44,7 +78,52 @@ def load_json(file_path):
         dict: Loaded JSON data
     """
     try:
+        if orjson is not None:
+            with open(file_path, 'rb') as file:
+                if os.fstat(file.fileno()).st_size <= JSON_BUFFER_SIZE:
+                    return orjson.loads(file.read())
+                # Parse large dumps straight from the mapped pages without an extra copy
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        return orjson.loads(view)
         with open(file_path, 'r') as file:
             return json.load(file)
     except Exception as e:
         raise Exception(f"Error loading JSON from {file_path}: {str(e)}")
+
+def parse_json(raw):
+    """
+    Parse a JSON document, using orjson when it is installed
+    
+    Args:
+        raw (bytes or str): JSON document
+        
+    Returns:
+        dict: Parsed JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def get_db_connection(db_path, readonly=False):
+    """
+    Open a SQLite connection with rows accessible by column name
+    
+    Args:
+        db_path (str): Path to the SQLite database file
+        readonly (bool): Open the database in read-only mode, skipping write locking
+        
+    Returns:
+        sqlite3.Connection: Database connection
+    """
+    try:
+        if readonly:
+            uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+        else:
+            conn = sqlite3.connect(db_path, cached_statements=256)
+        conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        conn.row_factory = sqlite3.Row
+        return conn
+    except Exception as e:
+        raise Exception(f"Error connecting to database {db_path}: {str(e)}")
@@ -18,6 +18,13 @@ def setup_logger(name='trading_signal_ai', log_file='logs/pipeline.log', level=l
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
+    # Don't add duplicate handlers if the logger was already configured
+    if logger.handlers:
+        return logger
+    
+    # Avoid writing every record again through the root logger
+    logger.propagate = False
+    
     # Create directory for log file if it doesn't exist
     os.makedirs(os.path.dirname(log_file), exist_ok=True)
     
@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from urllib.parse import quote
+
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+from src.data_acquisition.create_database import TICKER_STATS_SELECT
+from src.utils.logger import logger
+
+# Display names for ticker statistics, including the derived columns
+TICKER_STATS_LABELS = {
+    'ticker': 'Ticker',
+    'first_date': 'First Date',
+    'last_date': 'Last Date',
+    'date_range_days': 'Days of History',
+    'years_of_data': 'Years of Data',
+    'record_count': 'Total Records',
+    'completeness': 'Completeness',
+    'recent_3y_count': '3yr Records',
+    'ytd_count': 'YTD Records',
+    'avg_open': 'Avg Open',
+    'avg_close': 'Avg Close',
+    'max_high': 'High',
+    'min_low': 'Low',
+    'total_volume': 'Total Volume',
+    'avg_volume': 'Avg Volume'
+}
+
+# DataFrame.to_string formatters for the labelled numeric columns
+TICKER_STATS_FORMATTERS = {
+    'Years of Data': "{:.1f}".format,
+    'Completeness': "{:.1%}".format,
+    'Avg Open': "${:.2f}".format,
+    'Avg Close': "${:.2f}".format,
+    'High': "${:.2f}".format,
+    'Low': "${:.2f}".format,
+    'Total Volume': "{:,.0f}".format,
+    'Avg Volume': "{:,.0f}".format
+}
+
+def label_ticker_stats(df, columns):
+    """
+    Add years of data and completeness to raw ticker_stats rows and apply display names
+
+    Args:
+        df (pd.DataFrame): Rows with the ticker_stats view columns
+        columns (list): Statistics to return, in display order, from TICKER_STATS_LABELS
+
+    Returns:
+        pd.DataFrame: Selected statistics with display column names
+    """
+    df = df.copy()
+
+    # Assuming 252 trading days per year (standard in finance)
+    df['years_of_data'] = df['date_range_days'] / 365.0
+    expected_trading_days = (df['years_of_data'] * 252).astype(int)
+    df['completeness'] = np.where(expected_trading_days > 0, df['record_count'] / expected_trading_days, 0.0)
+
+    return df[columns].rename(columns=TICKER_STATS_LABELS)
+
+def _connectorx_uri(db_path):
+    """Build a connectorx SQLite URI, percent-encoding the absolute database path"""
+    return f"sqlite://{quote(str(Path(db_path).resolve()))}"
+
+def get_ticker_stats(conn, columns):
+    """
+    Load per-ticker statistics with derived years of data and completeness
+
+    When connectorx is installed the rows are fetched straight into columnar
+    memory from the database file behind conn instead of through sqlite3 rows.
+
+    Args:
+        conn (sqlite3.Connection): Database connection
+        columns (list): Statistics to return, in display order, from TICKER_STATS_LABELS
+
+    Returns:
+        pd.DataFrame: One row per ticker, ordered by ticker, with display column names
+    """
+    has_view = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'view' AND name = 'ticker_stats'"
+    ).fetchone() is not None
+
+    if has_view:
+        sql = "SELECT * FROM ticker_stats ORDER BY ticker"
+    else:
+        logger.warning("ticker_stats view not found, aggregating ohlcv directly. "
+                       "Run src/data_acquisition/create_database.py to create it.")
+        sql = f"{TICKER_STATS_SELECT} ORDER BY ticker"
+
+    # PRAGMA database_list reports an empty file name for in-memory databases
+    db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    if cx is not None and db_file:
+        df = cx.read_sql(_connectorx_uri(db_file), sql, return_type='pandas')
+    else:
+        df = pd.read_sql_query(sql, conn)
+
+    return label_ticker_stats(df, columns)
@@ -1,21 +1,20 @@
 #!/usr/bin/env python3
 """
 Test script for Alpha Vantage API
-Usage: python test_alpha_vantage.py [ticker]
+Usage: python test_alpha_vantage.py [ticker] [--save-raw] [--use-cache]
 """
 
 import sys
-from src.data_acquisition.fetch_data import test_alpha_vantage_api
+from src.data_acquisition.fetch_data import parse_args, test_alpha_vantage_api
 
 if __name__ == "__main__":
-    ticker = 'AAPL'
-    if len(sys.argv) > 1:
-        ticker = sys.argv[1]
+    args = parse_args()
+    ticker = args.ticker
     
     print(f"Testing Alpha Vantage API with ticker {ticker}...")
     print(f"Results will be logged to logs/pipeline.log")
     
-    success = test_alpha_vantage_api(ticker)
+    success = test_alpha_vantage_api(ticker, save_raw=args.save_raw, use_cache=args.use_cache)
     
     if success:
         print("Test successful! Check logs/pipeline.log for details.")
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path so we can import our modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_acquisition.create_database import create_database
+from src.utils.file_io import SQLITE_MMAP_SIZE, get_db_connection
+
+ROWS = [
+    ('AAA', '2020-01-02', 1.0, 2.0, 0.5, 1.5, 100),
+    ('AAA', '2021-01-04', 1.0, 2.0, 0.5, 1.5, 300),
+    ('BBB', '2021-01-04', 3.0, 4.0, 2.5, 3.5, 200)
+]
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'market_data.db')
+    assert create_database(path)
+    conn = get_db_connection(path)
+    with conn:
+        conn.executemany("INSERT INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)", ROWS)
+    conn.close()
+    return path
+
+def test_primary_key_index_is_not_duplicated(db_path):
+    conn = get_db_connection(db_path)
+    indexes = {row['name'] for row in conn.execute("PRAGMA index_list(ohlcv)")}
+    conn.close()
+
+    assert 'idx_ohlcv_ticker_date' not in indexes
+    assert 'idx_ohlcv_nulls' in indexes
+
+@pytest.mark.parametrize('readonly', [False, True])
+def test_connections_memory_map_the_database(db_path, readonly):
+    conn = get_db_connection(db_path, readonly=readonly)
+    mmap_size = conn.execute("PRAGMA mmap_size").fetchone()[0]
+    conn.close()
+
+    assert mmap_size == SQLITE_MMAP_SIZE
@@ -0,0 +1,247 @@
+import os
+import sys
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+# Add the project root to the path so we can import our modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_acquisition import fetch_data
+from src.data_acquisition.create_database import create_database
+from src.data_acquisition.fetch_data import AlphaVantageAPI, iter_ohlcv_rows, store_daily_time_series
+from src.utils.file_io import get_db_connection, parse_json
+
+SAMPLE_RESPONSE = b'{"Time Series (Daily)": {"2024-01-02": {"1. open": "1.0", "2. high": "2.0", "3. low": "0.5", "4. close": "1.5", "5. volume": "100"}}}'
+SAMPLE_CSV = b'timestamp,open,high,low,close,volume\r\n2024-01-03,1.5,2.5,1.0,2.0,200\r\n2024-01-02,1.0,2.0,0.5,1.5,100\r\n'
+
+class FakeClock:
+    """Monotonic clock whose sleep() advances time instead of blocking"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with mock.patch.object(fetch_data.time, 'monotonic', fake.monotonic), \
+            mock.patch.object(fetch_data.time, 'sleep', fake.sleep):
+        yield fake
+
+def make_client(rate_limit=5, cache_dir=None):
+    client = AlphaVantageAPI(api_key='test')
+    client.rate_limit = rate_limit
+    client.cache_dir = cache_dir
+    client.session.get = mock.Mock(return_value=mock.Mock(content=SAMPLE_RESPONSE))
+    return client
+
+def test_calls_within_rate_limit_do_not_wait(clock):
+    client = make_client(rate_limit=3)
+
+    for symbol in ['AAA', 'BBB', 'CCC']:
+        assert client.get_daily_time_series(symbol) is not None
+
+    assert clock.sleeps == []
+    assert client.session.get.call_count == 3
+
+def test_call_over_rate_limit_waits_for_window(clock):
+    client = make_client(rate_limit=2)
+
+    client.get_daily_time_series('AAA')
+    clock.now = 10.0
+    client.get_daily_time_series('BBB')
+    client.get_daily_time_series('CCC')
+
+    # The third call waits until the first one leaves the 60 second window
+    assert clock.sleeps == [50.0]
+    assert list(client._call_times) == [10.0, 60.0]
+
+def test_window_slides_after_sixty_seconds(clock):
+    client = make_client(rate_limit=1)
+
+    client.get_daily_time_series('AAA')
+    clock.now = 60.0
+    client.get_daily_time_series('BBB')
+
+    assert clock.sleeps == []
+
+def test_batch_returns_data_keyed_by_symbol(clock):
+    client = make_client(rate_limit=2)
+
+    results = client.get_daily_time_series_batch(iter(['AAA', 'BBB', 'CCC']))
+
+    assert list(results) == ['AAA', 'BBB', 'CCC']
+    assert all('Time Series (Daily)' in data for data in results.values())
+    assert client.session.get.call_count == 3
+
+def write_config(tmp_path, max_calls_per_minute):
+    config_path = tmp_path / 'data_sources.yaml'
+    config_path.write_text(
+        "api_keys:\n"
+        "  alpha_vantage: 'test'\n"
+        "alpha_vantage:\n"
+        "  base_url: 'https://www.alphavantage.co/query'\n"
+        "  output_format: 'json'\n"
+        f"  max_calls_per_minute: {max_calls_per_minute}\n"
+    )
+    return str(config_path)
+
+def test_pool_size_follows_rate_limit(tmp_path):
+    client = AlphaVantageAPI(config_path=write_config(tmp_path, 20))
+
+    adapter = client.session.get_adapter('https://www.alphavantage.co')
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 20
+
+@pytest.mark.parametrize('max_calls', ['0', '-1', "'5'", 'true'])
+def test_invalid_rate_limit_raises(tmp_path, max_calls):
+    with pytest.raises(ValueError):
+        AlphaVantageAPI(config_path=write_config(tmp_path, max_calls))
+
+def test_response_cached_for_the_day(clock, tmp_path):
+    client = make_client(cache_dir=str(tmp_path))
+
+    first = client.get_daily_time_series('AAA', use_cache=True)
+    second = client.get_daily_time_series('AAA', use_cache=True)
+
+    assert first == second
+    assert client.session.get.call_count == 1
+    assert len(list(tmp_path.glob('AAA_compact_*.json'))) == 1
+
+def test_cache_is_off_by_default(clock, tmp_path):
+    client = make_client(cache_dir=str(tmp_path))
+
+    client.get_daily_time_series('AAA')
+    client.get_daily_time_series_batch(['AAA'])
+
+    assert client.session.get.call_count == 2
+    assert list(tmp_path.iterdir()) == []
+
+def test_cache_keyed_by_date_and_earlier_days_pruned(clock, tmp_path):
+    client = make_client(cache_dir=str(tmp_path))
+
+    with mock.patch.object(fetch_data, 'datetime') as fake_datetime:
+        fake_datetime.now.return_value.strftime.return_value = '20240102'
+        client.get_daily_time_series('AAA', use_cache=True)
+        client.get_daily_time_series('BBB', use_cache=True)
+        fake_datetime.now.return_value.strftime.return_value = '20240103'
+        client.get_daily_time_series('AAA', use_cache=True)
+
+    assert client.session.get.call_count == 3
+    assert [path.name for path in tmp_path.iterdir()] == ['AAA_compact_20240103.json']
+
+def test_rate_limit_notes_are_not_cached(clock, tmp_path):
+    client = make_client(cache_dir=str(tmp_path))
+    client.session.get.return_value = mock.Mock(content=b'{"Note": "API call frequency exceeded"}')
+
+    client.get_daily_time_series('AAA', use_cache=True)
+
+    assert list(tmp_path.iterdir()) == []
+
+def test_unreadable_cache_file_is_refetched(clock, tmp_path):
+    client = make_client(cache_dir=str(tmp_path))
+    client.get_daily_time_series('AAA', use_cache=True)
+    next(tmp_path.iterdir()).write_text('{not json')
+
+    data = client.get_daily_time_series('AAA', use_cache=True)
+
+    assert 'Time Series (Daily)' in data
+    assert client.session.get.call_count == 2
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'market_data.db')
+    assert create_database(path)
+    return path
+
+def read_ohlcv(db_path):
+    conn = get_db_connection(db_path, readonly=True)
+    rows = [tuple(row) for row in conn.execute("SELECT * FROM ohlcv ORDER BY ticker, date")]
+    conn.close()
+    return rows
+
+def test_iter_ohlcv_rows_from_json():
+    rows = list(iter_ohlcv_rows('AAA', parse_json(SAMPLE_RESPONSE)))
+
+    assert rows == [('AAA', '2024-01-02', 1.0, 2.0, 0.5, 1.5, 100)]
+
+def test_store_daily_time_series(db_path):
+    data = parse_json(SAMPLE_RESPONSE)
+    data['Time Series (Daily)']['2024-01-03'] = {
+        '1. open': '1.5', '2. high': '2.5', '3. low': '1.0', '4. close': '2.0', '5. volume': '200'
+    }
+
+    assert store_daily_time_series('AAA', data, db_path) == 2
+    assert read_ohlcv(db_path) == [
+        ('AAA', '2024-01-02', 1.0, 2.0, 0.5, 1.5, 100),
+        ('AAA', '2024-01-03', 1.5, 2.5, 1.0, 2.0, 200)
+    ]
+
+def test_storing_again_replaces_rows(db_path):
+    store_daily_time_series('AAA', parse_json(SAMPLE_RESPONSE), db_path)
+    updated = parse_json(SAMPLE_RESPONSE.replace(b'"4. close": "1.5"', b'"4. close": "1.75"'))
+
+    store_daily_time_series('AAA', updated, db_path)
+
+    assert read_ohlcv(db_path) == [('AAA', '2024-01-02', 1.0, 2.0, 0.5, 1.75, 100)]
+
+def test_csv_response_parsed_into_dataframe(clock):
+    client = make_client()
+    client.session.get.return_value = mock.Mock(content=SAMPLE_CSV)
+
+    data = client.get_daily_time_series('AAA', datatype='csv')
+
+    assert list(data.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    assert data['timestamp'].tolist() == ['2024-01-03', '2024-01-02']
+    assert client.session.get.call_args.kwargs['params']['datatype'] == 'csv'
+
+@pytest.mark.parametrize('body', [
+    b'{"Error Message": "Invalid API call"}',
+    b'{"Note": "API call frequency exceeded"}'
+])
+def test_csv_mode_json_errors_return_none_and_are_not_cached(clock, tmp_path, body):
+    client = make_client(cache_dir=str(tmp_path))
+    client.session.get.return_value = mock.Mock(content=body)
+
+    assert client.get_daily_time_series('AAA', use_cache=True, datatype='csv') is None
+    assert list(tmp_path.iterdir()) == []
+
+def test_csv_cache_round_trip(clock, tmp_path):
+    client = make_client(cache_dir=str(tmp_path))
+    client.session.get.return_value = mock.Mock(content=SAMPLE_CSV)
+
+    fetched = client.get_daily_time_series('AAA', use_cache=True, datatype='csv')
+    cached = client.get_daily_time_series('AAA', use_cache=True, datatype='csv')
+
+    assert client.session.get.call_count == 1
+    assert len(list(tmp_path.glob('AAA_compact_*.csv'))) == 1
+    pd.testing.assert_frame_equal(cached, fetched)
+
+def test_iter_ohlcv_rows_from_csv_dataframe(clock):
+    client = make_client()
+    client.session.get.return_value = mock.Mock(content=SAMPLE_CSV)
+    data = client.get_daily_time_series('AAA', datatype='csv')
+
+    rows = list(iter_ohlcv_rows('AAA', data))
+
+    assert rows == [
+        ('AAA', '2024-01-03', 1.5, 2.5, 1.0, 2.0, 200),
+        ('AAA', '2024-01-02', 1.0, 2.0, 0.5, 1.5, 100)
+    ]
+
+def test_api_check_requests_json_when_csv_is_configured(clock):
+    client = make_client()
+    client.output_format = 'csv'
+
+    with mock.patch.object(fetch_data, 'AlphaVantageAPI', return_value=client):
+        assert fetch_data.test_alpha_vantage_api('AAA')
+
+    assert client.session.get.call_args.kwargs['params']['datatype'] == 'json'
@@ -0,0 +1,31 @@
+import os
+import sys
+from unittest import mock
+
+import pytest
+
+# Add the project root to the path so we can import our modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import file_io
+from src.utils.file_io import load_json, save_json
+
+DATA = {'Meta Data': {'2. Symbol': 'ÄBC'}, 1: [1.5, 2, None, True]}
+
+def test_save_json_output_does_not_depend_on_orjson(tmp_path):
+    pytest.importorskip('orjson')
+    with_orjson = tmp_path / 'orjson.json'
+    without_orjson = tmp_path / 'json.json'
+
+    save_json(DATA, str(with_orjson))
+    with mock.patch.object(file_io, 'orjson', None):
+        save_json(DATA, str(without_orjson))
+
+    assert with_orjson.read_bytes() == without_orjson.read_bytes()
+
+def test_save_json_coerces_non_string_keys(tmp_path):
+    path = str(tmp_path / 'data.json')
+
+    save_json({1: 2}, path)
+
+    assert load_json(path) == {'1': 2}
@@ -0,0 +1,81 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+from unittest import mock
+
+# Add the project root to the path so we can import our modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.data_acquisition.create_database import create_database
+from src.utils.file_io import get_db_connection
+from src.utils import ticker_stats
+from src.utils.ticker_stats import TICKER_STATS_LABELS, get_ticker_stats
+
+ROWS = [
+    ('AAA', '2020-01-02', 1.0, 2.0, 0.5, 1.5, 100),
+    ('AAA', '2021-01-04', 1.0, 2.0, 0.5, 1.5, 300),
+    ('BBB', '2021-01-04', 3.0, 4.0, 2.5, 3.5, 200)
+]
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / 'market_data.db')
+    assert create_database(path)
+    conn = get_db_connection(path)
+    with conn:
+        conn.executemany("INSERT INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)", ROWS)
+    conn.close()
+    return path
+
+def test_ticker_stats_labels_and_completeness(db_path):
+    conn = get_db_connection(db_path, readonly=True)
+    df = get_ticker_stats(conn, ['ticker', 'record_count', 'date_range_days', 'completeness'])
+    conn.close()
+
+    assert list(df.columns) == ['Ticker', 'Total Records', 'Days of History', 'Completeness']
+    assert df['Ticker'].tolist() == ['AAA', 'BBB']
+    # 368 days of history -> 254 expected trading days; a single day has none
+    assert df['Completeness'].tolist() == pytest.approx([2 / 254, 0.0])
+
+def test_ticker_stats_without_view_falls_back_to_aggregate(db_path):
+    conn = get_db_connection(db_path)
+    with conn:
+        conn.execute("DROP VIEW ticker_stats")
+    conn.close()
+
+    conn = get_db_connection(db_path, readonly=True)
+    df = get_ticker_stats(conn, ['ticker', 'record_count', 'avg_volume'])
+    conn.close()
+
+    assert df.to_dict('list') == {
+        'Ticker': ['AAA', 'BBB'],
+        'Total Records': [2, 1],
+        'Avg Volume': [200.0, 200.0]
+    }
+
+def test_connectorx_uri_percent_encodes_the_resolved_path(tmp_path):
+    db_path = tmp_path / 'market data%.db'
+
+    uri = ticker_stats._connectorx_uri(str(db_path))
+
+    assert uri == f"sqlite://{str(db_path.resolve()).replace('%', '%25').replace(' ', '%20')}"
+
+def test_connectorx_and_sqlite3_frames_match(tmp_path):
+    pytest.importorskip('connectorx')
+    path = str(tmp_path / 'market data.db')
+    assert create_database(path)
+    conn = get_db_connection(path)
+    with conn:
+        conn.executemany("INSERT INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)", ROWS)
+    conn.close()
+
+    conn = get_db_connection(path, readonly=True)
+    columns = list(TICKER_STATS_LABELS)
+    columnar = get_ticker_stats(conn, columns)
+    with mock.patch.object(ticker_stats, 'cx', None):
+        rows = get_ticker_stats(conn, columns)
+    conn.close()
+
+    pd.testing.assert_frame_equal(columnar, rows, check_dtype=False)